@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from routers.ocr_router import router as ocr_router
 
 # Create FastAPI app
@@ -8,7 +9,8 @@ app = FastAPI(
     description="Microservice for extracting text from images using OCR",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -34,7 +36,8 @@ async def root():
         "endpoints": {
             "health": "/",
             "docs": "/docs",
-            "ocr_extract": "/ocr/extract"
+            "ocr_extract": "/ocr/extract",
+            "ocr_batch": "/ocr/batch"
         }
     }
 
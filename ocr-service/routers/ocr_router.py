@@ -1,5 +1,6 @@
+from typing import List, Optional
 from fastapi import APIRouter, File, UploadFile, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from service.ocr_service import OCRService
 
 router = APIRouter(prefix="/ocr", tags=["OCR"])
@@ -24,7 +25,45 @@ async def extract_text_from_image(
     try:
         result = await ocr_service.extract_text_from_file(file, language)
         
-        return JSONResponse(
+        return ORJSONResponse(
+            status_code=200,
+            content={
+                "status": "success",
+                "data": result
+            }
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal server error: {str(e)}"
+        )
+
+
+@router.post("/batch")
+async def extract_text_from_images(
+    files: List[UploadFile] = File(...),
+    language: str = Query(default='en', description="Language code for OCR (e.g., 'en', 'tamil', 'hin')"),
+    columns: Optional[str] = Query(default=None, description="Comma-separated columns to return (e.g., 'text,confidence')")
+):
+    """
+    Extract text from multiple uploaded image files in a single OCR batch
+    
+    Args:
+        files: Uploaded image files (JPG, PNG, PDF, etc.)
+        language: Language code for OCR processing
+        columns: Optional comma-separated subset of columns to return
+        
+    Returns:
+        JSON response with parallel per-file lists for each column
+    """
+    try:
+        column_list = [column.strip() for column in columns.split(',') if column.strip()] if columns else None
+        result = await ocr_service.extract_text_from_files(files, language, column_list)
+        
+        return ORJSONResponse(
             status_code=200,
             content={
                 "status": "success",
@@ -47,7 +86,7 @@ async def get_ocr_engines_status():
     try:
         status = ocr_service.get_engine_status()
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "status": "success",
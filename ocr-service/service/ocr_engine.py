@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, List
 from .ocr_strategy import OCREngineStrategy, OCREngineFactory
 
 
@@ -54,6 +54,43 @@ class OCREngine:
             }
         }
     
+    def extract_text_batch(self, image_paths: List[str], language: str = 'en') -> dict:
+        """
+        Extract text from multiple image files using primary OCR engine with fallback
+        
+        Args:
+            image_paths: Paths of the image files to process
+            language: Language code for OCR
+            
+        Returns:
+            Dictionary containing per-image results in input order
+        """
+        # Try primary engine first
+        if self.primary_engine.is_available():
+            result = self.primary_engine.extract_text_batch(image_paths, language)
+            if result["success"]:
+                return result
+        
+        # Fallback to secondary engine
+        if self.fallback_engine.is_available():
+            result = self.fallback_engine.extract_text_batch(image_paths, language)
+            if result["success"]:
+                for item in result["results"]:
+                    item["metadata"]["fallback_used"] = True
+                    item["metadata"]["primary_engine"] = self.primary_engine.__class__.__name__
+                return result
+        
+        # Both engines failed
+        return {
+            "success": False,
+            "error": "Both OCR engines failed or are unavailable",
+            "text": "",
+            "metadata": {
+                "primary_engine": self.primary_engine.__class__.__name__,
+                "fallback_engine": self.fallback_engine.__class__.__name__
+            }
+        }
+    
     def get_engine_status(self) -> dict:
         """Get status of both OCR engines"""
         return {
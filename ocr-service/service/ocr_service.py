@@ -1,8 +1,22 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from fastapi import UploadFile, HTTPException
+from fastapi.concurrency import run_in_threadpool
 import os
+import tempfile
+import numpy as np
 from .ocr_engine import OCREngine
 
+# Batch response columns and the keys they are returned under
+BATCH_COLUMNS = {
+    'filename': 'filenames',
+    'file_size': 'file_sizes',
+    'text': 'texts',
+    'confidence': 'confidences',
+    'word_count': 'word_counts',
+    'char_count': 'char_counts',
+    'engine': 'engines'
+}
+
 
 class OCRService:
     """Service layer for OCR operations"""
@@ -11,6 +25,7 @@ class OCRService:
         self.ocr_engine = OCREngine(primary_engine='paddleocr', fallback_engine='tesseract')
         self.max_file_size = 50 * 1024 * 1024  # 50MB
         self.allowed_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.pdf'}
+        self.read_chunk_size = 1024 * 1024  # 1MB
     
     async def extract_text_from_file(self, file: UploadFile, language: str = 'en') -> Dict[str, Any]:
         """
@@ -26,27 +41,67 @@ class OCRService:
         Raises:
             HTTPException: For validation or processing errors
         """
-        # Validate file size
-        content = await file.read()
+        content = await self._read_validated(file)
         file_size = len(content)
         
-        if file_size > self.max_file_size:
+        # Perform OCR using engine with fallback, off the event loop
+        result = await run_in_threadpool(self.ocr_engine.extract_text_from_image, content, file.filename, language)
+        
+        if not result["success"]:
             raise HTTPException(
-                status_code=413,
-                detail=f"File too large. Maximum size is {self.max_file_size // (1024*1024)}MB"
+                status_code=500,
+                detail=f"OCR processing failed: {result['error']}"
             )
         
-        # Validate file type
-        file_extension = os.path.splitext(file.filename)[1].lower()
+        return {
+            "filename": file.filename,
+            "file_size": file_size,
+            "extracted_text": result["text"],
+            "metadata": result["metadata"]
+        }
+    
+    async def extract_text_from_files(self, files: List[UploadFile], language: str = 'en',
+                                      columns: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Extract text from multiple uploaded files in a single OCR batch
         
-        if file_extension not in self.allowed_extensions:
+        Args:
+            files: Uploaded file instances
+            language: Language code for OCR (default: 'en')
+            columns: Optional subset of BATCH_COLUMNS to return (default: all)
+            
+        Returns:
+            Dictionary of parallel per-file lists, one per requested column
+            
+        Raises:
+            HTTPException: For validation or processing errors
+        """
+        columns = columns or list(BATCH_COLUMNS)
+        unknown = [column for column in columns if column not in BATCH_COLUMNS]
+        if unknown:
             raise HTTPException(
                 status_code=400,
-                detail=f"Unsupported file type. Allowed types: {', '.join(self.allowed_extensions)}"
+                detail=f"Unknown columns: {', '.join(unknown)}. Allowed columns: {', '.join(BATCH_COLUMNS)}"
             )
         
-        # Perform OCR using engine with fallback
-        result = self.ocr_engine.extract_text_from_image(content, file.filename, language)
+        with tempfile.TemporaryDirectory(prefix='ocr_batch_') as batch_dir:
+            image_paths = []
+            file_sizes = []
+            
+            for index, file in enumerate(files):
+                content = await self._read_validated(file)
+                file_extension = os.path.splitext(file.filename)[1].lower()
+                
+                # Index-based names avoid collisions between uploads
+                image_path = os.path.join(batch_dir, f"{index}{file_extension}")
+                with open(image_path, 'wb') as image_file:
+                    image_file.write(content)
+                
+                image_paths.append(image_path)
+                file_sizes.append(len(content))
+            
+            # Perform OCR using engine with fallback, off the event loop
+            result = await run_in_threadpool(self.ocr_engine.extract_text_batch, image_paths, language)
         
         if not result["success"]:
             raise HTTPException(
@@ -54,12 +109,59 @@ class OCRService:
                 detail=f"OCR processing failed: {result['error']}"
             )
         
-        return {
-            "filename": file.filename,
-            "file_size": file_size,
-            "extracted_text": result["text"],
-            "metadata": result["metadata"]
+        # Column-oriented layout: one list per field rather than one dict per file
+        items = result["results"]
+        confidences = np.fromiter((item["metadata"]["confidence"] for item in items), dtype=np.float64, count=len(items))
+        data = {
+            'filename': [file.filename for file in files],
+            'file_size': file_sizes,
+            'text': [item["text"] for item in items],
+            'confidence': confidences.tolist(),
+            'word_count': [item["metadata"]["word_count"] for item in items],
+            'char_count': [item["metadata"]["char_count"] for item in items],
+            'engine': [item["metadata"]["engine"] for item in items]
         }
+        
+        response = {"file_count": len(files)}
+        for column in columns:
+            response[BATCH_COLUMNS[column]] = data[column]
+        
+        if 'confidence' in columns:
+            response["mean_confidence"] = float(confidences.mean()) if confidences.size else 0.0
+        
+        return response
+    
+    async def _read_validated(self, file: UploadFile) -> bytes:
+        """
+        Read an uploaded file and validate its size and type
+        
+        Raises:
+            HTTPException: If the file is too large or of an unsupported type
+        """
+        # Validate file type before reading any content
+        file_extension = os.path.splitext(file.filename)[1].lower()
+        
+        if file_extension not in self.allowed_extensions:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported file type. Allowed types: {', '.join(self.allowed_extensions)}"
+            )
+        
+        # Validate file size while reading in chunks, stopping as soon as the limit is exceeded
+        buffer = bytearray()
+        
+        while chunk := await file.read(self.read_chunk_size):
+            buffer.extend(chunk)
+            
+            if len(buffer) > self.max_file_size:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"File too large. Maximum size is {self.max_file_size // (1024*1024)}MB"
+                )
+        
+        content = bytes(buffer)
+        
+        return content
     
     def get_engine_status(self) -> Dict[str, Any]:
         """Get status of available OCR engines"""
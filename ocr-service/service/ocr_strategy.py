@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List
+import os
 
 
 class OCREngineStrategy(ABC):
@@ -20,6 +21,33 @@ class OCREngineStrategy(ABC):
         """
         pass
     
+    def extract_text_batch(self, image_paths: List[str], language: str = 'en') -> Dict[str, Any]:
+        """
+        Extract text from multiple image files
+        
+        Default implementation runs extract_text once per image; engines with
+        a native batch mode should override this.
+        
+        Args:
+            image_paths: Paths of the image files to process
+            language: Language code for OCR
+            
+        Returns:
+            Dictionary containing per-image results in input order
+        """
+        results = []
+        
+        for image_path in image_paths:
+            with open(image_path, 'rb') as image_file:
+                result = self.extract_text(image_file.read(), os.path.basename(image_path), language)
+            
+            if not result["success"]:
+                return result
+            
+            results.append({"text": result["text"], "metadata": result["metadata"]})
+        
+        return {"success": True, "results": results}
+    
     @abstractmethod
     def is_available(self) -> bool:
         """Check if the OCR engine is available and properly configured"""
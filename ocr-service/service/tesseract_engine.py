@@ -1,21 +1,62 @@
-from typing import Dict, Any
+from typing import Dict, Any, ClassVar, List, Optional, Tuple
+from collections import OrderedDict
+import hashlib
 import io
+import json
+import os
+import subprocess
+import tempfile
+import threading
+import numpy as np
 from PIL import Image
 import pytesseract
 from .ocr_strategy import OCREngineStrategy
 
+try:
+    # Optional in-process bindings; avoids a tesseract subprocess per call
+    from tesserocr import PyTessBaseAPI, PSM
+except ImportError:
+    PyTessBaseAPI = None
+    PSM = None
+
+try:
+    from blake3 import blake3 as _content_hash
+except ImportError:
+    _content_hash = hashlib.sha1
+
 
 class TesseractEngine(OCREngineStrategy):
     """Tesseract OCR implementation for text extraction from images"""
     
+    # Maximum number of images per Tesseract list file; very long lists can hang tesseract
+    BATCH_CHUNK_SIZE = 256
+    
+    # Maximum number of OCR results kept in the content-hash LRU cache
+    CACHE_MAX_ENTRIES = 1024
+    
+    # Result of the tesseract binary probe, shared by all instances in the process
+    _version_probe: ClassVar[Optional[bool]] = None
+    
     def __init__(self):
-        try:
-            # Test Tesseract availability
-            pytesseract.get_tesseract_version()
-            self.available = True
-        except Exception as e:
-            print(f"Tesseract initialization failed: {e}")
-            self.available = False
+        # LRU cache of serialized OCR results keyed by (content hash, language)
+        self._cache: "OrderedDict[Tuple[bytes, str], str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Persistent tesserocr API handles, one per language, created lazily
+        self._apis: Dict[str, Tuple[Any, threading.Lock]] = {}
+        self._lock = threading.Lock()
+        
+        # Test Tesseract availability once per process
+        if TesseractEngine._version_probe is None:
+            try:
+                if PyTessBaseAPI is None:
+                    pytesseract.get_tesseract_version()
+                TesseractEngine._version_probe = True
+            except Exception as e:
+                print(f"Tesseract initialization failed: {e}")
+                TesseractEngine._version_probe = False
+        
+        self.available = TesseractEngine._version_probe
     
     def extract_text(self, image_data: bytes, filename: str = None, language: str = 'en') -> Dict[str, Any]:
         """
@@ -29,6 +70,32 @@ class TesseractEngine(OCREngineStrategy):
         Returns:
             Dictionary containing extracted text and metadata
         """
+        key = (_content_hash(image_data).digest(), language)
+        
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        
+        if cached is not None:
+            result = json.loads(cached)
+            result["metadata"]["filename"] = filename
+            return result
+        
+        result = self._extract_text_uncached(image_data, filename, language)
+        
+        # Only successful results are cached so transient failures can be retried
+        if result["success"]:
+            with self._cache_lock:
+                self._cache[key] = json.dumps(result)
+                self._cache.move_to_end(key)
+                if len(self._cache) > self.CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+        
+        return result
+    
+    def _extract_text_uncached(self, image_data: bytes, filename: str = None, language: str = 'en') -> Dict[str, Any]:
+        """Run Tesseract OCR on image data, bypassing the result cache"""
         try:
             if not self.is_available():
                 return {
@@ -38,41 +105,45 @@ class TesseractEngine(OCREngineStrategy):
                     "metadata": {}
                 }
             
-            # Create a file-like object from image bytes
-            image_stream = io.BytesIO(image_data)
-            
-            # Open and validate the image
-            image = Image.open(image_stream)
-            
             # Configure language for Tesseract
             lang_config = language if language != 'en' else 'eng'
             
-            # Extract text using Tesseract OCR
-            text_content = pytesseract.image_to_string(image, lang=lang_config)
-            
-            # Get additional OCR data for confidence
-            try:
-                ocr_data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT, lang=lang_config)
-                avg_confidence = self._calculate_average_confidence(ocr_data)
-            except:
-                avg_confidence = 0.0
+            if PyTessBaseAPI is not None:
+                # Open and validate the image, introspecting it in a single pass
+                image = Image.open(io.BytesIO(image_data))
+                image.load()
+                width, height = image.size
+                mode = image.mode
+                image_size = {"width": width, "height": height, "mode": mode}
+                
+                # Hand tesseract a mode it accepts directly; grayscale suits it best
+                if mode not in ('L', 'RGB'):
+                    image = image.convert('L')
+                
+                # Reuse the cached API handle for this language
+                text_content, avg_confidence = self._recognize_with_api(image, lang_config)
+            else:
+                # Pipe the raw bytes to tesseract instead of a PIL image,
+                # which pytesseract would otherwise re-encode to a temp PNG on disk
+                image_size = self._probe_image(io.BytesIO(image_data))
+                
+                # A single TSV pass yields both the text and the confidences
+                ocr_data = self._image_to_data_stdin(image_data, lang_config)
+                text_content, confidences = self._assemble_pages(ocr_data, 1)[0]
+                avg_confidence = self._calculate_average_confidence({'conf': confidences})
             
-            # Calculate word count and character count
-            words = text_content.split()
-            word_count = len(words)
+            # Strip once and derive both counts from the returned text
+            text_content = text_content.strip()
+            word_count = len(text_content.split())
             char_count = len(text_content)
             
             return {
                 "success": True,
-                "text": text_content.strip(),
+                "text": text_content,
                 "metadata": {
                     "filename": filename,
                     "engine": "tesseract",
-                    "image_size": {
-                        "width": image.width,
-                        "height": image.height,
-                        "mode": image.mode
-                    },
+                    "image_size": image_size,
                     "char_count": char_count,
                     "word_count": word_count,
                     "confidence": avg_confidence,
@@ -88,10 +159,215 @@ class TesseractEngine(OCREngineStrategy):
                 "metadata": {"engine": "tesseract"}
             }
     
+    def extract_text_batch(self, image_paths: List[str], language: str = 'en') -> Dict[str, Any]:
+        """
+        Extract text from multiple image files using Tesseract's file-list mode
+        
+        All images in a chunk are processed by a single tesseract invocation,
+        so process start-up and model loading are paid once per chunk.
+        
+        Args:
+            image_paths: Paths of the image files to process
+            language: Language code for OCR
+            
+        Returns:
+            Dictionary containing per-image results in input order
+        """
+        if PyTessBaseAPI is not None:
+            # Cached API handles already avoid per-image start-up
+            return super().extract_text_batch(image_paths, language)
+        
+        try:
+            if not self.is_available():
+                return {
+                    "success": False,
+                    "error": "Tesseract is not installed or not in PATH",
+                    "text": "",
+                    "metadata": {}
+                }
+            
+            lang_config = language if language != 'en' else 'eng'
+            results = [None] * len(image_paths)
+            
+            # List mode numbers pages across all inputs, so a multi-frame image
+            # (e.g. a multi-page TIFF) would shift every later result; OCR those one at a time
+            list_indexes = []
+            for index, image_path in enumerate(image_paths):
+                if not self._is_multi_frame(image_path):
+                    list_indexes.append(index)
+                    continue
+                
+                with open(image_path, 'rb') as image_file:
+                    result = self.extract_text(image_file.read(), os.path.basename(image_path), language)
+                if not result["success"]:
+                    return result
+                results[index] = {"text": result["text"], "metadata": result["metadata"]}
+            
+            for start in range(0, len(list_indexes), self.BATCH_CHUNK_SIZE):
+                chunk_indexes = list_indexes[start:start + self.BATCH_CHUNK_SIZE]
+                chunk = [image_paths[index] for index in chunk_indexes]
+                for index, result in zip(chunk_indexes, self._extract_chunk(chunk, lang_config, language)):
+                    results[index] = result
+            
+            return {"success": True, "results": results}
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "text": "",
+                "metadata": {"engine": "tesseract"}
+            }
+    
+    def _extract_chunk(self, image_paths: List[str], lang_config: str, language: str) -> List[Dict[str, Any]]:
+        """Run one tesseract invocation over a list file of image paths"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as list_file:
+            list_file.write('\n'.join(image_paths))
+        
+        try:
+            # A single TSV pass yields both the text and the confidences of every page
+            ocr_data = pytesseract.image_to_data(list_file.name, output_type=pytesseract.Output.DICT, lang=lang_config)
+            pages = self._assemble_pages(ocr_data, len(image_paths))
+        finally:
+            os.remove(list_file.name)
+        
+        results = []
+        for image_path, (text_content, confidences) in zip(image_paths, pages):
+            text_content = text_content.strip()
+            results.append({
+                "text": text_content,
+                "metadata": {
+                    "filename": os.path.basename(image_path),
+                    "engine": "tesseract",
+                    "char_count": len(text_content),
+                    "word_count": len(text_content.split()),
+                    "confidence": self._calculate_average_confidence({'conf': confidences}),
+                    "language": language
+                }
+            })
+        
+        return results
+    
+    @staticmethod
+    def _image_to_data_stdin(image_data: bytes, lang_config: str) -> Dict[str, list]:
+        """Run tesseract on in-memory image bytes via stdin and parse its TSV output"""
+        process = subprocess.run(
+            [pytesseract.pytesseract.tesseract_cmd, 'stdin', 'stdout', '-l', lang_config, 'tsv'],
+            input=image_data,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        if process.returncode != 0:
+            raise RuntimeError(process.stderr.decode('utf-8', errors='replace').strip())
+        
+        rows = process.stdout.decode('utf-8').splitlines()
+        header = rows[0].split('\t') if rows else []
+        ocr_data = {column: [] for column in header}
+        
+        for row in rows[1:]:
+            values = row.split('\t')
+            # Rows without recognized text omit the trailing text column
+            values += [''] * (len(header) - len(values))
+            for column, value in zip(header, values):
+                if column == 'text':
+                    ocr_data[column].append(value)
+                elif column == 'conf':
+                    ocr_data[column].append(float(value))
+                else:
+                    ocr_data[column].append(int(value))
+        
+        return ocr_data
+    
+    @staticmethod
+    def _assemble_pages(ocr_data: dict, page_count: int) -> List[Tuple[str, list]]:
+        """Rebuild per-page text and word confidences from image_to_data output"""
+        pages = [([], []) for _ in range(page_count)]
+        last_keys = [None] * page_count
+        
+        for level, page_num, block_num, par_num, line_num, word, conf in zip(
+            ocr_data['level'], ocr_data['page_num'], ocr_data['block_num'], ocr_data['par_num'],
+            ocr_data['line_num'], ocr_data['text'], ocr_data['conf']
+        ):
+            # Level 5 rows are words; other levels only describe layout
+            if level != 5 or not 0 < page_num <= page_count:
+                continue
+            
+            lines, confidences = pages[page_num - 1]
+            confidences.append(conf)
+            
+            if not word.strip():
+                continue
+            
+            key = (block_num, par_num, line_num)
+            last_key = last_keys[page_num - 1]
+            if key != last_key:
+                # Separate paragraphs with a blank line, as image_to_string does
+                if last_key is not None and key[:2] != last_key[:2]:
+                    lines.append([])
+                lines.append([])
+                last_keys[page_num - 1] = key
+            lines[-1].append(word)
+        
+        return [
+            ('\n'.join(' '.join(words) for words in lines), confidences)
+            for lines, confidences in pages
+        ]
+    
+    @staticmethod
+    def _is_multi_frame(image_path: str) -> bool:
+        """Check whether an image file holds more than one frame or page"""
+        with Image.open(image_path) as image:
+            return getattr(image, 'n_frames', 1) > 1
+    
+    @staticmethod
+    def _probe_image(image_source: Any) -> Dict[str, Any]:
+        """Read image dimensions and mode without decoding the full raster"""
+        # Image.open only parses the header; the raster is never loaded here
+        with Image.open(image_source) as image:
+            return {"width": image.width, "height": image.height, "mode": image.mode}
+    
+    def _get_api(self, lang_config: str) -> Tuple[Any, threading.Lock]:
+        """Get or lazily create the tesserocr API handle for a language"""
+        with self._lock:
+            if lang_config not in self._apis:
+                self._apis[lang_config] = (PyTessBaseAPI(lang=lang_config, psm=PSM.AUTO), threading.Lock())
+            return self._apis[lang_config]
+    
+    def _recognize_with_api(self, image: Image.Image, lang_config: str) -> Tuple[str, float]:
+        """Run OCR on a persistent tesserocr handle, returning text and average confidence"""
+        api, api_lock = self._get_api(lang_config)
+        
+        # Feed the decoded raster directly; SetImage would re-encode it through a temp buffer
+        bytes_per_pixel = len(image.getbands())
+        width, height = image.size
+        image_bytes = image.tobytes()
+        
+        # A single handle is not thread-safe, serialize use per language
+        with api_lock:
+            api.SetImageBytes(image_bytes, width, height, bytes_per_pixel, width * bytes_per_pixel)
+            text_content = api.GetUTF8Text()
+            confidences = api.AllWordConfidences()
+        
+        return text_content, self._calculate_average_confidence({'conf': confidences})
+    
+    def close(self) -> None:
+        """Release all cached tesserocr API handles"""
+        with self._lock:
+            for api, _ in self._apis.values():
+                api.End()
+            self._apis.clear()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
     def _calculate_average_confidence(self, ocr_data: dict) -> float:
         """Calculate average confidence from OCR data"""
-        confidences = [int(conf) for conf in ocr_data['conf'] if int(conf) > 0]
-        return sum(confidences) / len(confidences) if confidences else 0.0
+        confidences = np.asarray(ocr_data['conf'], dtype=np.int16)
+        positive = confidences[confidences > 0]
+        return float(positive.mean()) if positive.size else 0.0
     
     def is_available(self) -> bool:
         """Check if Tesseract is available"""
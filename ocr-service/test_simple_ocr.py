@@ -15,15 +15,17 @@ def test_simple_ocr():
     url = "http://localhost:8001/ocr/extract"
     
     try:
-        # Open and send the image
-        with open(image_path, "rb") as image_file:
+        # Open and send the image over a reusable session
+        with requests.Session() as session, open(image_path, "rb") as image_file:
             files = {"file": (image_path, image_file, "image/png")}
-            response = requests.post(url, files=files)
+            response = session.post(url, files=files)
         
         print(f"Status Code: {response.status_code}")
         result = response.json()
-        print(f"Extracted Text: '{result['data']['extracted_text']}'")
-        print(f"Confidence: {result['data']['metadata']['confidence']}%")
+        data = result['data']
+        metadata = data['metadata']
+        print(f"Extracted Text: '{data['extracted_text']}'")
+        print(f"Confidence: {metadata['confidence']}%")
         print(f"Full Response: {result}")
         
     except requests.exceptions.ConnectionError:
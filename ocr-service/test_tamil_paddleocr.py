@@ -15,20 +15,22 @@ def test_tamil_paddleocr():
     url = "http://localhost:8001/ocr/extract"
     
     try:
-        # Open and send the image with Tamil language parameter
-        with open(image_path, "rb") as image_file:
+        # Open and send the image over a reusable session with Tamil language parameter
+        with requests.Session() as session, open(image_path, "rb") as image_file:
             files = {"file": (image_path, image_file, "image/png")}
             params = {"language": "tamil"}
-            response = requests.post(url, files=files, params=params)
+            response = session.post(url, files=files, params=params)
         
         print(f"Status Code: {response.status_code}")
         result = response.json()
-        print(f"Extracted Text: '{result['data']['extracted_text']}'")
-        print(f"Engine Used: {result['data']['metadata'].get('engine', 'unknown')}")
-        print(f"Confidence: {result['data']['metadata'].get('confidence', 'N/A')}%")
-        print(f"Fallback Used: {result['data']['metadata'].get('fallback_used', False)}")
-        print(f"Word Count: {result['data']['metadata']['word_count']}")
-        print(f"Character Count: {result['data']['metadata']['char_count']}")
+        data = result['data']
+        metadata = data['metadata']
+        print(f"Extracted Text: '{data['extracted_text']}'")
+        print(f"Engine Used: {metadata.get('engine', 'unknown')}")
+        print(f"Confidence: {metadata.get('confidence', 'N/A')}%")
+        print(f"Fallback Used: {metadata.get('fallback_used', False)}")
+        print(f"Word Count: {metadata['word_count']}")
+        print(f"Character Count: {metadata['char_count']}")
         print(f"Full Response: {result}")
         
     except requests.exceptions.ConnectionError:
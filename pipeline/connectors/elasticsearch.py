@@ -1,8 +1,11 @@
+import logging
 from elasticsearch import Elasticsearch
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Iterable, Optional
 from .base import BaseConnector
 from .registry import ConnectorRegistry
 
+logger = logging.getLogger(__name__)
+
 
 class ElasticsearchConnector(BaseConnector):
     """Elasticsearch connector using YAML configuration."""
@@ -149,8 +152,8 @@ class ElasticsearchConnector(BaseConnector):
         except Exception as e:
             raise e
     
-    def bulk_index(self, actions: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Bulk index documents in Elasticsearch."""
+    def bulk_index(self, actions: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Bulk index documents in Elasticsearch from a list or lazy iterable of actions."""
         if not self._client:
             raise ConnectionError("Not connected to Elasticsearch")
         
@@ -177,7 +180,7 @@ class ElasticsearchConnector(BaseConnector):
         try:
             return self._client.indices.exists(index=index_name)
         except Exception as e:
-            print(f"Error checking if index exists: {e}")
+            logger.error(f"Error checking if index {index_name} exists: {e}")
             return False
 
     def create_index(self, index_name: str, body: Dict[str, Any] = None) -> bool:
@@ -193,10 +196,10 @@ class ElasticsearchConnector(BaseConnector):
         try:
             return self._client.indices.create(index=index_name, body=body)
         except Exception as e:
-            print(f"Error creating index: {e}")
+            logger.error(f"Error creating index {index_name}: {e}")
             return False
     
-    def bulk(self, actions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def bulk(self, actions: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
         """Bulk operations in Elasticsearch (alias for bulk_index)."""
         return self.bulk_index(actions)
     
@@ -217,7 +220,7 @@ class ElasticsearchConnector(BaseConnector):
                 response = self._client.count(body=body) if body else self._client.count()
             return response.get('count', 0)
         except Exception as e:
-            print(f"Error counting documents: {e}")
+            logger.error(f"Error counting documents: {e}")
             return 0
     
     def delete_by_query(self, index: str, body: Dict[str, Any]) -> Dict[str, Any]:
@@ -233,7 +236,7 @@ class ElasticsearchConnector(BaseConnector):
         try:
             return self._client.delete_by_query(index=index, body=body)
         except Exception as e:
-            print(f"Error deleting by query: {e}")
+            logger.error(f"Error deleting by query on index {index}: {e}")
             return {}
     
     def close(self) -> None:
@@ -1,7 +1,8 @@
-import pickle
+import json
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Dict, Optional
 from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build, Resource
 from .base import BaseConnector
@@ -11,6 +12,9 @@ from .registry import ConnectorRegistry
 class GmailConnector(BaseConnector):
     """Gmail API connector for fetching emails and attachments."""
 
+    # Credentials shared across connector instances, keyed by token path
+    _creds_cache: ClassVar[Dict[str, Credentials]] = {}
+
     def __init__(self, name: str, config: dict):
         """
         Args:
@@ -36,11 +40,22 @@ class GmailConnector(BaseConnector):
 
     def connect(self) -> None:
         """Authenticate and build Gmail service client."""
-        creds = None
+        creds = self._creds_cache.get(self.token_path)
 
-        if Path(self.token_path).exists():
-            with open(self.token_path, "rb") as token:
-                creds = pickle.load(token)
+        token_file = Path(self.token_path)
+        if creds is None and token_file.exists():
+            try:
+                creds = Credentials.from_authorized_user_info(
+                    json.loads(token_file.read_bytes()), self.scopes
+                )
+            except (ValueError, UnicodeDecodeError):
+                # Legacy pickled token; never unpickle it. Fail loudly rather than
+                # falling through to the browser flow, which blocks headless runs
+                raise ConnectionError(
+                    f"Gmail token at {self.token_path} is in the legacy pickle format and "
+                    f"is no longer loaded. Delete it and re-authenticate interactively "
+                    f"to write a JSON token."
+                )
 
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
@@ -51,13 +66,15 @@ class GmailConnector(BaseConnector):
                 )
                 creds = flow.run_local_server(port=self.auth_port)
 
-            with open(self.token_path, "wb") as token:
-                pickle.dump(creds, token)
+            token_file.write_text(creds.to_json())
 
+        self._creds_cache[self.token_path] = creds
         self.service = build("gmail", self.api_version, credentials=creds)
+        self._connection = self.service
 
     def disconnect(self) -> None:
         self.service = None
+        self._connection = None
 
     def test_connection(self) -> bool:
         """Test Gmail connection."""
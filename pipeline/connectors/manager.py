@@ -1,11 +1,33 @@
 """Manager class for handling multiple connectors."""
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import yaml
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from .base import BaseConnector
 from .factory import ConnectorFactory
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed config files shared across managers, keyed by (path, mtime)
+_CONFIG_CACHE: Dict[Tuple[str, float], Dict[str, Any]] = {}
+
+
+def _load_yaml_config(path: str) -> Dict[str, Any]:
+    """Load a YAML config file, reusing the parsed result until the file changes."""
+    key = (path, os.stat(path).st_mtime)
+    config = _CONFIG_CACHE.get(key)
+    
+    if config is None:
+        with open(path, 'rb') as file:
+            config = yaml.load(file, Loader=_YAML_LOADER) or {}
+        _CONFIG_CACHE[key] = config
+    
+    return config
+
 
 class ConnectorManager:
     """Manager class for handling multiple connectors."""
@@ -22,25 +44,54 @@ class ConnectorManager:
         self.config_path = config_path
         self._connectors: Dict[str, BaseConnector] = {}
         self._config: Optional[Dict[str, Any]] = None
+        self._connect_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.RLock()
     
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         if self._config is None:
-            try:
-                with open(self.config_path, 'r') as file:
-                    self._config = yaml.safe_load(file) or {}
-            except FileNotFoundError:
-                self._config = {}
-            except Exception as e:
-                raise ValueError(f"Failed to load config file {self.config_path}: {e}")
+            with self._lock:
+                if self._config is None:
+                    self._config = self._read_config()
         
         return self._config
     
-    def get_connector(self, name: str) -> BaseConnector:
-        """Get or create a connector by name."""
-        if name not in self._connectors:
-            self._connectors[name] = self._create_connector(name)
-        return self._connectors[name]
+    def _read_config(self) -> Dict[str, Any]:
+        """Read the YAML config file, treating a missing file as empty config."""
+        try:
+            return _load_yaml_config(self.config_path)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            raise ValueError(f"Failed to load config file {self.config_path}: {e}")
+    
+    def get_connector(self, name: str, connect: bool = False) -> BaseConnector:
+        """Get or create a connector by name.
+        
+        Args:
+            name: Connector name from the config file
+            connect: Connect the connector on first use if it isn't connected yet
+        """
+        connector = self._connectors.get(name)
+        
+        if connector is None:
+            # Double-checked so concurrent callers never create the same connector twice
+            with self._lock:
+                connector = self._connectors.get(name)
+                if connector is None:
+                    connector = self._create_connector(name)
+                    self._connectors[name] = connector
+        
+        if connect and not connector.is_connected():
+            # Per-connector lock so different connectors can connect in parallel;
+            # looked up under self._lock since disconnect_all clears the dict
+            with self._lock:
+                connect_lock = self._connect_locks.setdefault(name, threading.Lock())
+            with connect_lock:
+                if not connector.is_connected():
+                    connector.connect()
+        
+        return connector
     
     def _create_connector(self, name: str) -> BaseConnector:
         """Create a connector from configuration."""
@@ -66,17 +117,40 @@ class ConnectorManager:
     def connect_all(self) -> None:
         """Connect all configured connectors."""
         for name in self.list_connectors():
-            connector = self.get_connector(name)
-            if not connector.is_connected():
-                connector.connect()
+            self.get_connector(name, connect=True)
+    
+    def test_all_connections(self) -> Dict[str, bool]:
+        """Connect and test every configured connector concurrently.
+        
+        Returns:
+            Mapping of connector name to whether its connection test passed
+        """
+        names = self.list_connectors()
+        if not names:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(names))) as executor:
+            results = executor.map(self._test_connection, names)
+            return dict(zip(names, results))
+    
+    def _test_connection(self, name: str) -> bool:
+        """Connect a single connector and run its connection test."""
+        try:
+            connector = self.get_connector(name, connect=True)
+            test_connection = getattr(connector, 'test_connection', None)
+            return test_connection() if test_connection else connector.is_connected()
+        except Exception:
+            return False
     
     def disconnect_all(self) -> None:
         """Disconnect all connectors."""
-        for connector in self._connectors.values():
-            try:
-                if connector.is_connected():
-                    connector.disconnect()
-            except Exception:
-                pass
-        
-        self._connectors.clear()
+        with self._lock:
+            for connector in self._connectors.values():
+                try:
+                    if connector.is_connected():
+                        connector.disconnect()
+                except Exception:
+                    pass
+            
+            self._connectors.clear()
+            self._connect_locks.clear()
@@ -1,103 +1,189 @@
+import os
+import threading
+from functools import cached_property
 from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
-from typing import Any, Dict, Optional
+from sqlalchemy.engine import Engine, URL
+from sqlalchemy.sql.elements import TextClause
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple, Union
 from .base import BaseConnector
 from .registry import ConnectorRegistry
 
+# Statements built once at import; SQLAlchemy reuses their compiled form across calls
+_HEALTHCHECK_QUERY = text("SELECT 1")
+_VERSION_QUERY = text("SELECT version()")
+
 
 class PostgresConnector(BaseConnector):
     """PostgreSQL connector using YAML configuration and SQLAlchemy."""
     
+    # Engines shared across connectors, keyed by connection URL and engine parameters
+    _engine_cache: ClassVar[Dict[Tuple, Engine]] = {}
+    
+    # Number of connected instances holding each cached engine; disposed when it drops to zero
+    _engine_refcounts: ClassVar[Dict[Tuple, int]] = {}
+    _engine_lock: ClassVar[threading.Lock] = threading.Lock()
+    
     def __init__(self, name: str, config: Dict[str, Any]):
         super().__init__(name, config)
         self._engine: Optional[Engine] = None
+        self._engine_key: Optional[Tuple] = None
+    
+    @cached_property
+    def _connection_settings(self) -> Tuple[URL, Dict[str, Any]]:
+        """Build the SQLAlchemy URL and engine parameters once from YAML configuration."""
+        # Get connection configuration from YAML
+        connection_config = self.config.get('connection', {})
+        
+        # Add any additional config, separating SQLAlchemy-specific params
+        connection_params = connection_config.get('connection_params', {})
+        
+        # Separate PostgreSQL-specific parameters from SQLAlchemy engine parameters
+        pg_params = {}
+        engine_params = {}
+        
+        for key, value in connection_params.items():
+            if key in ['connect_timeout', 'application_name']:
+                # These go in the connection string
+                pg_params[key] = str(value)
+            else:
+                # These go to create_engine
+                engine_params[key] = value
+        
+        database = connection_config.get('database')
+        if not database:
+            raise ValueError("Database name is required")
+        
+        # Create connection URL with PostgreSQL-specific parameters
+        connection_url = URL.create(
+            drivername='postgresql',
+            username=connection_config.get('user'),
+            password=connection_config.get('password'),
+            host=connection_config.get('host') or 'localhost',
+            port=connection_config.get('port') or 5432,
+            database=database,
+            query=pg_params
+        )
+        
+        # Let the pool check liveness on checkout instead of probing per connect
+        engine_params.setdefault('pool_pre_ping', True)
+        
+        # Hand out the most recently used connection so idle overflow ages out quickly
+        engine_params.setdefault('pool_use_lifo', True)
+        
+        # Keep a few warm connections and allow bursts up to 16 for concurrent tasks
+        engine_params.setdefault('pool_size', 4)
+        engine_params.setdefault('max_overflow', 12)
+        
+        # Page executemany() through psycopg2's execute_batch instead of one round trip per row
+        engine_params.setdefault('executemany_mode', 'values_plus_batch')
+        engine_params.setdefault('executemany_batch_page_size', 1000)
+        
+        return connection_url, engine_params
     
     def connect(self) -> None:
         """Establish PostgreSQL connection using YAML configuration and SQLAlchemy."""
         try:
-            # Get connection configuration from YAML
-            connection_config = self.config.get('connection', {})
+            connection_url, engine_params = self._connection_settings
             
-            # Build connection parameters from YAML config only
-            conn_params = {
-                'host': connection_config.get('host'),
-                'port': connection_config.get('port'),
-                'database': connection_config.get('database'),
-                'user': connection_config.get('user'),
-                'password': connection_config.get('password')
-            }
+            # repr() keeps the key hashable when params hold dicts (connect_args,
+            # execution_options); the pid keeps forked workers off the parent's pool
+            engine_key = (connection_url, repr(sorted(engine_params.items())), os.getpid())
+            if self._engine is not None and self._engine_key == engine_key:
+                # Already holding a reference to this engine
+                return
             
-            # Remove None values
-            conn_params = {k: v for k, v in conn_params.items() if v is not None}
+            # Reuse a cached engine and its pool when one exists for these settings
+            with self._engine_lock:
+                engine = self._engine_cache.get(engine_key)
+                if engine is not None:
+                    self._engine_refcounts[engine_key] += 1
             
-            # Add any additional config, separating SQLAlchemy-specific params
-            connection_params = connection_config.get('connection_params', {})
-            
-            # Separate PostgreSQL-specific parameters from SQLAlchemy engine parameters
-            pg_params = {}
-            engine_params = {}
-            
-            for key, value in connection_params.items():
-                if key in ['connect_timeout', 'application_name']:
-                    # These go in the connection string
-                    pg_params[key] = value
-                else:
-                    # These go to create_engine
-                    engine_params[key] = value
-            
-            # Build connection URL for SQLAlchemy
-            username = conn_params.pop('user', None)
-            password = conn_params.pop('password', None)
-            host = conn_params.pop('host', 'localhost')
-            port = conn_params.pop('port', 5432)
-            database = conn_params.pop('database', None)
-            
-            if not database:
-                raise ValueError("Database name is required")
-            
-            # Create connection URL with PostgreSQL-specific parameters
-            connection_url = f"postgresql://{username}:{password}@{host}:{port}/{database}"
-            
-            # Add PostgreSQL-specific parameters to URL
-            if pg_params:
-                param_string = "&".join([f"{k}={v}" for k, v in pg_params.items()])
-                connection_url += f"?{param_string}"
-            
-            # Create SQLAlchemy engine with valid engine parameters
-            self._engine = create_engine(connection_url, **engine_params)
-            
-            # Test connection
-            with self._engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
+            if engine is None:
+                # Create and test the engine outside the lock so connectors connect concurrently
+                new_engine = create_engine(connection_url, **engine_params)
+                with new_engine.connect() as conn:
+                    conn.execute(_HEALTHCHECK_QUERY)
+                
+                with self._engine_lock:
+                    engine = self._engine_cache.setdefault(engine_key, new_engine)
+                    self._engine_refcounts[engine_key] = self._engine_refcounts.get(engine_key, 0) + 1
+                
+                if engine is not new_engine:
+                    # Another connector cached an engine for these settings first
+                    new_engine.dispose()
             
+            self._engine_key = engine_key
+            self._engine = engine
             self._connection = self._engine
             
         except Exception as e:
             raise ConnectionError(f"Failed to connect to PostgreSQL: {e}")
     
     def disconnect(self) -> None:
-        """Close PostgreSQL connection."""
+        """Close PostgreSQL connection, disposing the engine once no other connector shares it."""
         try:
             if self._engine:
-                self._engine.dispose()
-                self._engine = None
+                engine, self._engine = self._engine, None
+                with self._engine_lock:
+                    remaining = self._engine_refcounts.get(self._engine_key, 1) - 1
+                    if remaining > 0:
+                        self._engine_refcounts[self._engine_key] = remaining
+                    else:
+                        self._engine_refcounts.pop(self._engine_key, None)
+                        self._engine_cache.pop(self._engine_key, None)
+                        engine.dispose()
             self._connection = None
         except Exception as e:
             raise ConnectionError(f"Error disconnecting from PostgreSQL: {e}")
     
+    def test_connection(self) -> bool:
+        """Test PostgreSQL connection."""
+        try:
+            if not self._engine:
+                return False
+            
+            with self._engine.connect() as conn:
+                return conn.execute(_HEALTHCHECK_QUERY).scalar() == 1
+        except Exception:
+            return False
+    
+    def get_connection_info(self) -> Dict[str, Any]:
+        """Get PostgreSQL connection information."""
+        if not self._engine:
+            return {"status": "disconnected"}
+        
+        try:
+            with self._engine.connect() as conn:
+                version = conn.execute(_VERSION_QUERY).scalar()
+            
+            url = self._engine.url
+            return {
+                "status": "connected",
+                "host": url.host,
+                "port": url.port,
+                "database": url.database,
+                "version": version
+            }
+        except Exception as e:
+            return {"status": "error", "error": str(e)}
+    
     def get_connection(self) -> Optional[Engine]:
         """Return the live database engine."""
         return self._engine
     
-    def execute_query(self, query: str, params: Optional[dict] = None) -> list:
-        """Execute a query and return results."""
+    def execute_query(self, query: Union[str, TextClause], params: Optional[dict] = None) -> list:
+        """Execute a query and return results.
+        
+        ``query`` may be a SQL string or a prebuilt ``text()`` statement that
+        callers reuse across executions.
+        """
         if not self._engine:
             raise ConnectionError("Not connected to PostgreSQL")
         
         try:
             with self._engine.connect() as conn:
                 # Use text() for SQL injection protection
-                sql_query = text(query)
+                sql_query = text(query) if isinstance(query, str) else query
                 
                 # Execute query with parameters
                 if params:
@@ -107,17 +193,65 @@ class PostgresConnector(BaseConnector):
                 
                 # Check if query returns data
                 if result.returns_rows:
-                    # Get column names
-                    columns = list(result.keys())
-                    rows = result.fetchall()
-                    # Convert to list of dictionaries
-                    return [dict(zip(columns, row)) for row in rows]
+                    # Convert to list of dictionaries; callers may mutate the rows
+                    return [dict(row) for row in result.mappings()]
                 
                 return []
                 
         except Exception as e:
             raise e
 
+    
+    def execute_query_iter(self, query: str, params: Optional[dict] = None,
+                           itersize: int = 10000) -> Iterator[Dict[str, Any]]:
+        """Execute a query and lazily yield result rows as dictionaries.
+        
+        Rows are streamed from a server-side cursor in batches of ``itersize``
+        instead of being fetched into memory all at once.
+        
+        Args:
+            query: SQL query with named parameters (e.g. ``:id``)
+            params: Optional query parameters
+            itersize: Number of rows fetched from the server per round trip
+        """
+        if not self._engine:
+            raise ConnectionError("Not connected to PostgreSQL")
+        
+        with self._engine.connect() as conn:
+            result = conn.execute(
+                text(query), params or {},
+                execution_options={'stream_results': True, 'max_row_buffer': itersize}
+            )
+            
+            if not result.returns_rows:
+                return
+            
+            for partition in result.mappings().partitions(itersize):
+                for row in partition:
+                    yield dict(row)
+    
+    def execute_many(self, query: str, params_list: List[dict]) -> int:
+        """Execute a statement once per parameter set in a single transaction.
+        
+        Args:
+            query: SQL statement with named parameters (e.g. ``:id``)
+            params_list: One parameter dictionary per execution
+            
+        Returns:
+            Number of parameter sets executed
+        """
+        if not self._engine:
+            raise ConnectionError("Not connected to PostgreSQL")
+        
+        if not params_list:
+            return 0
+        
+        # A list of parameter sets makes SQLAlchemy use the batched executemany path
+        with self._engine.begin() as conn:
+            conn.execute(text(query), params_list)
+        
+        return len(params_list)
+
 
 # Register the connector
 ConnectorRegistry.register("postgres", PostgresConnector)
\ No newline at end of file
@@ -1,15 +1,24 @@
 # pipeline/extractors/postgres.py
+import logging
 from typing import Iterator, Dict, Any
+from sqlalchemy import text
 from .base import BaseExtractor
 from .registry import ExtractorRegistry
 
+logger = logging.getLogger(__name__)
+
 
 class PostgresExtractor(BaseExtractor):
     def __init__(self, name: str, connector, config: Dict[str, Any]):
         super().__init__(name, connector, config)
 
     def extract(self) -> Iterator[Dict[str, Any]]:
-        """Extract data from PostgreSQL tables based on configuration."""
+        """Extract data from PostgreSQL tables based on configuration.
+        
+        A table with ``key_column`` is paged in key order and its ``order_by``
+        is ignored; without it, rows are fetched in one query ordered by
+        ``order_by``.
+        """
         tables = self.config.get('tables', [])
         
         for table_config in tables:
@@ -21,8 +30,12 @@ class PostgresExtractor(BaseExtractor):
             batch_size = table_config.get('batch_size', 1000)
             order_by = table_config.get('order_by')
             
+            key_column = table_config.get('key_column')
+            
             # Build query
             if columns:
+                if key_column and key_column not in columns:
+                    columns = [*columns, key_column]
                 columns_str = ', '.join(columns)
             else:
                 columns_str = '*'
@@ -34,18 +47,54 @@ class PostgresExtractor(BaseExtractor):
                 # For now, just extract all data - state management would be added here
                 pass
             
-            # Add ordering
-            if order_by:
-                query += f" ORDER BY {order_by}"
+            if key_column and order_by:
+                logger.warning(
+                    f"Table {table_name}: key_column '{key_column}' takes precedence, "
+                    f"ignoring order_by '{order_by}'"
+                )
             
-            # Execute query
-            rows = self.connector.execute_query(query)
+            if key_column:
+                # Keyset pagination on a unique key: each page seeks past the last key seen
+                rows = self._extract_keyset(query, key_column, batch_size)
+            else:
+                # Add ordering
+                if order_by:
+                    query += f" ORDER BY {order_by}"
+                
+                # Stream rows through a server-side cursor, batch_size rows per fetch
+                rows = self.connector.execute_query_iter(query, itersize=batch_size)
             
             # Add table name to each row for context
             for row in rows:
                 row['_source_table'] = table_name
                 yield row
 
+    def _extract_keyset(self, query: str, key_column: str, batch_size: int) -> Iterator[Dict[str, Any]]:
+        """Page through a query by seeking on a unique key column.
+        
+        Args:
+            query: Base SELECT statement without ordering
+            key_column: Unique, sortable column to paginate on
+            batch_size: Number of rows fetched per page
+            
+        Yields:
+            Row dictionaries in key order
+        """
+        # Build both page statements once; every page re-executes them with new bound values
+        first_page = text(f"SELECT * FROM ({query}) sub ORDER BY {key_column} LIMIT :batch_size")
+        next_page = text(
+            f"SELECT * FROM ({query}) sub WHERE {key_column} > :last "
+            f"ORDER BY {key_column} LIMIT :batch_size"
+        )
+        
+        rows = self.connector.execute_query(first_page, {'batch_size': batch_size})
+        while rows:
+            yield from rows
+            if len(rows) < batch_size:
+                break
+            rows = self.connector.execute_query(
+                next_page, {'last': rows[-1][key_column], 'batch_size': batch_size}
+            )
 
 # Register the extractor
 ExtractorRegistry.register("postgres", PostgresExtractor)
@@ -4,7 +4,6 @@ Embeddings Module - Vector generation using txtai
 
 from typing import List, Dict, Any, Optional
 import numpy as np
-from txtai.embeddings import Embeddings
 
 
 class EmbeddingAligner:
@@ -47,6 +46,9 @@ class EmbeddingAligner:
             if key not in ["path", "enabled", "content", "scoring", "backend"]:
                 embeddings_config[key] = value
         
+        # Import txtai on first use so loading the package stays cheap
+        from txtai.embeddings import Embeddings
+        
         self.embeddings = Embeddings(embeddings_config)
     
     def align_and_embed(self, chunks: List['Chunk']) -> List[Dict[str, Any]]:
@@ -71,18 +73,15 @@ class EmbeddingAligner:
             chunk_mapping[chunk.chunk_id] = chunk
         
         # Generate vectors using txtai (embedding only, no indexing)
-        # Generate vectors for each text individually
-        vectors_list = []
-        for item in txtai_input:
-            vector = self.embeddings.transform([item[1]])  # Transform each text individually
-            vectors_list.append(vector)
+        # Encode all texts in one batch and convert the 2D array to lists in a single call
+        vectors_list = self._to_lists(self.embeddings.batchtransform([item[1] for item in txtai_input]))
         
         # Create aligned records
         aligned_records = []
         for i, (chunk_id, text, tags) in enumerate(txtai_input):
             original_chunk = chunk_mapping[chunk_id]
             
-            vector = vectors_list[i].tolist() if hasattr(vectors_list[i], 'tolist') else vectors_list[i]
+            vector = vectors_list[i]
             
             aligned_record = {
                 'source_id': original_chunk.source_id,
@@ -108,17 +107,17 @@ class EmbeddingAligner:
         if not texts:
             return []
         
-        vectors = self.embeddings.transform(texts)
+        vectors = self.embeddings.batchtransform(texts)
         
-        # Convert to list format if needed
-        result = []
-        for vector in vectors:
-            if hasattr(vector, 'tolist'):
-                result.append(vector.tolist())
-            else:
-                result.append(vector)
+        return self._to_lists(vectors)
+    
+    @staticmethod
+    def _to_lists(vectors: Any) -> List[List[float]]:
+        """Convert a batch of vectors to nested lists with one bulk conversion."""
+        if hasattr(vectors, 'tolist'):
+            return vectors.tolist()
         
-        return result
+        return [vector.tolist() if hasattr(vector, 'tolist') else vector for vector in vectors]
     
     def __del__(self):
         """Cleanup resources."""
@@ -3,7 +3,7 @@ Simple Ingestor Module - Elasticsearch indexing logic using connectors
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 import time
 import logging
 from datetime import datetime
@@ -35,7 +35,9 @@ class BaseElasticsearchIngestor(BaseIngestor):
         self.index_name = config.get('index_name')
         self.max_retries = config.get('max_retries', 3)
         self.success_results = config.get('success_results', ['created', 'updated'])
+        self.vector_index = config.get('vector_index', {})
         self.logger = logging.getLogger(__name__)
+        self._index_ready = False
         
         # Get connector from manager
         connector_manager = ConnectorManager()
@@ -46,6 +48,39 @@ class BaseElasticsearchIngestor(BaseIngestor):
         # Connect to Elasticsearch
         self.connector.connect()
     
+    def _ensure_index(self, records: List[Dict[str, Any]]) -> None:
+        """Create the index with a quantized HNSW dense_vector mapping if it doesn't exist yet."""
+        if self._index_ready:
+            return
+        
+        vector = next((record['vector'] for record in records if record.get('vector') is not None), None)
+        if vector is None:
+            # Without vectors there is nothing to map explicitly; leave it to dynamic mapping
+            return
+        
+        if not self.connector.index_exists(self.index_name):
+            body = {
+                "mappings": {
+                    "properties": {
+                        "vector": {
+                            "type": "dense_vector",
+                            "dims": len(vector),
+                            "index": True,
+                            "similarity": self.vector_index.get('similarity', 'cosine'),
+                            "index_options": {
+                                "type": self.vector_index.get('type', 'int8_hnsw'),
+                                "m": self.vector_index.get('m', 16),
+                                "ef_construction": self.vector_index.get('ef_construction', 100)
+                            }
+                        }
+                    }
+                }
+            }
+            self.connector.create_index(self.index_name, body)
+            self.logger.info(f"Created index {self.index_name} with {len(vector)}-dim vector mapping")
+        
+        self._index_ready = True
+    
     def _create_document(self, record: Dict[str, Any]) -> Dict[str, Any]:
         """Create Elasticsearch document from record."""
         doc = {
@@ -72,6 +107,8 @@ class SingleIngestor(BaseElasticsearchIngestor):
             self.logger.warning("No records to ingest")
             return True
         
+        self._ensure_index(records)
+        
         success_count = 0
         
         for record in records:
@@ -120,6 +157,8 @@ class BulkIngestor(BaseElasticsearchIngestor):
             self.logger.warning("No records to ingest")
             return True
         
+        self._ensure_index(records)
+        
         success_count = 0
         total_count = len(records)
         
@@ -141,20 +180,10 @@ class BulkIngestor(BaseElasticsearchIngestor):
     
     def _ingest_batch(self, records: List[Dict[str, Any]]) -> bool:
         """Ingest a batch of records."""
-        actions = []
-        
-        for record in records:
-            doc = self._create_document(record)
-            action = {
-                "_index": self.index_name,
-                "_id": record['chunk_id'],
-                "_source": doc
-            }
-            actions.append(action)
-        
         for attempt in range(self.max_retries):
             try:
-                response = self.connector.bulk(actions)
+                # Fresh generator per attempt; actions are built as the bulk helper consumes them
+                response = self.connector.bulk(self._iter_actions(records))
                 
                 if response.get('failed_count', 0) > 0:
                     self.logger.warning(f"Bulk ingest had {response['failed_count']} errors")
@@ -170,3 +199,12 @@ class BulkIngestor(BaseElasticsearchIngestor):
                 time.sleep(self.max_retries * (attempt + 1))
         
         return False
+    
+    def _iter_actions(self, records: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Lazily yield bulk index actions for records."""
+        for record in records:
+            yield {
+                "_index": self.index_name,
+                "_id": record['chunk_id'],
+                "_source": self._create_document(record)
+            }
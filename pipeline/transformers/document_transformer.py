@@ -1,9 +1,11 @@
 # pipeline/transformers/document_transformer.py
-from typing import Iterator, Tuple, Any, Dict
+from collections import OrderedDict
+from typing import Iterator, Tuple, Any, Dict, Set
 from pathlib import Path
+import hashlib
 import json
+import os
 from .base import BaseTransformer
-from txtai.pipeline.data.textractor import Textractor
 
 
 class DocumentTransformer(BaseTransformer):
@@ -22,6 +24,9 @@ class DocumentTransformer(BaseTransformer):
         self.default_tag = config.get('default_tag')
         self.document_placeholder = config.get('document_placeholder', '[Document: {filename}]')
         
+        # Import txtai on first use so loading the package stays cheap
+        from txtai.pipeline.data.textractor import Textractor
+        
         # Initialize txtai Textractor pipeline with all parameters
         textractor_config = config.get('textractor', {})
         segmentation_config = config.get('segmentation', {})
@@ -29,6 +34,13 @@ class DocumentTransformer(BaseTransformer):
         # Pass all parameters to Textractor (it inherits from Segmentation)
         all_config = {**textractor_config, **segmentation_config}
         self.textractor = Textractor(**all_config)
+        
+        # Segmented output keyed by content digest, so re-processed mail skips Textractor
+        self.textractor_cache_size = config.get('textractor_cache_size', 1024)
+        self._textractor_cache: "OrderedDict[bytes, Any]" = OrderedDict()
+        
+        # File names per attachment directory, listed once per transform() run
+        self._dir_listings: Dict[Path, Set[str]] = {}
 
     def transform(self) -> Iterator[Tuple[str, str, list]]:
         """
@@ -48,6 +60,9 @@ class DocumentTransformer(BaseTransformer):
         with open(file_path, 'r') as f:
             records = json.load(f)
         
+        # Attachment directories may change between runs; list them afresh
+        self._dir_listings = {}
+        
         for record in records:
             record_id = record.get('id', '')
             
@@ -55,7 +70,7 @@ class DocumentTransformer(BaseTransformer):
             body = record.get('body', '')
             if body:
                 # Use txtai Textractor as callable to get chunks (not text() method)
-                processed_chunks = self.textractor(body)
+                processed_chunks = self._segment(body)
                 
                 # Textractor returns list of chunks when segmentation is enabled
                 if isinstance(processed_chunks, list):
@@ -75,7 +90,7 @@ class DocumentTransformer(BaseTransformer):
                     
                     if attachment_text:
                         # Use txtai Textractor as callable to get chunks
-                        processed_chunks = self.textractor(attachment_text)
+                        processed_chunks = self._segment(attachment_text)
                         
                         if isinstance(processed_chunks, list):
                             for i, chunk in enumerate(processed_chunks):
@@ -86,6 +101,21 @@ class DocumentTransformer(BaseTransformer):
                             tags = self._extract_tags(record) + [f"attachment:{attachment['filename']}"]
                             yield (attachment_id, processed_chunks, tags)
 
+    def _segment(self, text: str) -> Any:
+        """Run Textractor on text, reusing results for previously seen content."""
+        key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        
+        cached = self._textractor_cache.get(key)
+        if cached is not None:
+            self._textractor_cache.move_to_end(key)
+            return cached
+        
+        result = self.textractor(text)
+        self._textractor_cache[key] = result
+        if len(self._textractor_cache) > self.textractor_cache_size:
+            self._textractor_cache.popitem(last=False)
+        return result
+
     def _extract_tags(self, record: Dict[str, Any]) -> list:
         """Extract tags from record metadata."""
         tags = [self.default_tag] if self.default_tag else []
@@ -110,7 +140,7 @@ class DocumentTransformer(BaseTransformer):
         data_dir = Path(__file__).parent.parent.parent / self.config.get('data_dir', 'data')
         attachment_path = data_dir / attachment['path']
         
-        if not attachment_path.exists():
+        if not self._file_exists(attachment_path):
             return ""
         
         # Simple text extraction based on file extension
@@ -129,3 +159,16 @@ class DocumentTransformer(BaseTransformer):
             return self.document_placeholder.format(filename=attachment['filename'])
         
         return ""
+
+    def _file_exists(self, path: Path) -> bool:
+        """Check file existence against a cached listing of its directory."""
+        directory = path.parent
+        names = self._dir_listings.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    names = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                names = set()
+            self._dir_listings[directory] = names
+        return path.name in names
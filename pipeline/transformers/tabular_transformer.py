@@ -3,7 +3,6 @@ from typing import Iterator, Tuple, Any, Dict
 from pathlib import Path
 import json
 from .base import BaseTransformer
-from txtai.pipeline.data.tabular import Tabular
 
 
 class TabularTransformer(BaseTransformer):
@@ -18,6 +17,9 @@ class TabularTransformer(BaseTransformer):
         self.text_columns = config.get('text_columns', [])
         self.content_enabled = config.get('content_enabled', False)
         
+        # Import txtai on first use so loading the package stays cheap
+        from txtai.pipeline.data.tabular import Tabular
+        
         # Initialize txtai Tabular pipeline
         self.tabular = Tabular(
             idcolumn=self.id_column,
@@ -1,7 +1,9 @@
 """
 PostgreSQL connector implementation using SQLAlchemy ORM.
 """
-from typing import Any, Optional
+import os
+import threading
+from typing import Any, ClassVar, Dict, Optional, Tuple
 from sqlalchemy import create_engine, text, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
@@ -20,6 +22,14 @@ class PostgresConnector(BaseConnector):
     Implements connection pooling and event listeners.
     """
     
+    # Engines shared across connector instances, keyed by settings and process id
+    # so a forked worker never reuses its parent's pooled sockets
+    _engine_cache: ClassVar[Dict[Tuple, Engine]] = {}
+    
+    # Number of connected instances holding each cached engine; disposed when it drops to zero
+    _engine_refcounts: ClassVar[Dict[Tuple, int]] = {}
+    _engine_lock: ClassVar[threading.Lock] = threading.Lock()
+    
     def __init__(
         self,
         connection_string: str,
@@ -49,6 +59,7 @@ class PostgresConnector(BaseConnector):
         self.pool_recycle = pool_recycle
         self.echo = echo
         self._session_factory = None
+        self._engine_key: Optional[Tuple] = None
         self._setup_event_listeners()
     
     def _setup_event_listeners(self) -> None:
@@ -78,28 +89,63 @@ class PostgresConnector(BaseConnector):
             SQLAlchemy Engine instance
         """
         if self._engine is None:
+            engine_key = (
+                self.connection_string,
+                self.pool_size,
+                self.max_overflow,
+                self.pool_timeout,
+                self.pool_recycle,
+                self.echo,
+                repr(sorted(self.connection_params.items())),
+                os.getpid(),
+            )
+            with self._engine_lock:
+                cached_engine = self._engine_cache.get(engine_key)
+                if cached_engine is not None:
+                    self._engine_refcounts[engine_key] += 1
+            
+            if cached_engine is not None:
+                self._engine = cached_engine
+                self._engine_key = engine_key
+                self._session_factory = sessionmaker(bind=self._engine)
+                return self._engine
+            
             try:
-                self._engine = create_engine(
+                # Created and tested outside the lock so connectors connect concurrently
+                engine = create_engine(
                     self.connection_string,
                     poolclass=QueuePool,
                     pool_size=self.pool_size,
                     max_overflow=self.max_overflow,
                     pool_timeout=self.pool_timeout,
                     pool_recycle=self.pool_recycle,
+                    pool_use_lifo=True,
+                    pool_pre_ping=True,
                     echo=self.echo,
                     **self.connection_params
                 )
                 
-                # Create session factory
-                self._session_factory = sessionmaker(bind=self._engine)
-                
                 # Test connection
-                with self._engine.connect() as conn:
+                with engine.connect() as conn:
                     conn.execute(text("SELECT 1"))
                 
+                with self._engine_lock:
+                    self._engine = self._engine_cache.setdefault(engine_key, engine)
+                    self._engine_refcounts[engine_key] = self._engine_refcounts.get(engine_key, 0) + 1
+                
+                if self._engine is not engine:
+                    # Another instance cached an engine for these settings first
+                    engine.dispose()
+                
+                self._engine_key = engine_key
+                
+                # Create session factory
+                self._session_factory = sessionmaker(bind=self._engine)
                 logger.info("PostgreSQL connection established successfully")
                 
             except Exception as e:
+                self._engine = None
+                self._session_factory = None
                 logger.error(f"Failed to connect to PostgreSQL: {e}")
                 raise
         
@@ -107,13 +153,22 @@ class PostgresConnector(BaseConnector):
     
     def disconnect(self) -> None:
         """
-        Close the PostgreSQL connection and dispose of the engine.
+        Close the PostgreSQL connection; the shared engine is disposed once
+        no other connector instance holds it.
         """
         if self._engine is not None:
             try:
-                self._engine.dispose()
-                self._engine = None
+                engine, self._engine = self._engine, None
                 self._session_factory = None
+                with self._engine_lock:
+                    remaining = self._engine_refcounts.get(self._engine_key, 1) - 1
+                    if remaining > 0:
+                        self._engine_refcounts[self._engine_key] = remaining
+                    else:
+                        self._engine_refcounts.pop(self._engine_key, None)
+                        self._engine_cache.pop(self._engine_key, None)
+                        logger.debug(f"Pool status before dispose: {engine.pool.status()}")
+                        engine.dispose()
                 logger.info("PostgreSQL connection closed")
             except Exception as e:
                 logger.error(f"Error closing PostgreSQL connection: {e}")
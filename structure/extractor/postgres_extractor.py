@@ -1,12 +1,13 @@
 """
 PostgreSQL extractor with incremental extraction support.
 """
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 import pandas as pd
 from sqlalchemy import text, MetaData, Table
 import logging
 from datetime import datetime
 
+from ..utils import isoformat_series
 from .base import BaseExtractor
 from .config import TableConfig, ExtractionMode
 
@@ -34,14 +35,24 @@ class PostgresExtractor(BaseExtractor):
     def _serialize_timestamps(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Convert all pandas Timestamp columns in the DataFrame to ISO strings.
+        
+        Output matches ``Timestamp.isoformat()`` (see ``isoformat_series``).
+        Only the converted columns are copied, and a frame without datetime
+        columns is returned as is.
         """
-        # Create a copy to avoid modifying the original DataFrame
-        df = df.copy()
+        datetime_columns = [
+            col for col, dtype in df.dtypes.items()
+            if pd.api.types.is_datetime64_any_dtype(dtype)
+        ]
+        if not datetime_columns:
+            return df
+        
+        serialized = {}
         
-        for col in df.columns:
-            if pd.api.types.is_datetime64_any_dtype(df[col]):
-                df[col] = df[col].apply(lambda x: x.isoformat() if pd.notnull(x) else None)
-        return df
+        for col in datetime_columns:
+            serialized[col] = isoformat_series(df[col])
+        
+        return df.assign(**serialized)
     
     def extract(
         self,
@@ -90,39 +101,114 @@ class PostgresExtractor(BaseExtractor):
         else:
             raise ValueError(f"Unsupported extraction mode: {config.extraction_mode}")
     
-    def _extract_full(self, config: TableConfig) -> pd.DataFrame:
+    def _build_query(self, config: TableConfig) -> Tuple[str, Dict[str, Any]]:
         """
-        Perform full table extraction.
+        Build the SELECT statement for a table extraction.
+        
+        Date range bounds are passed as bound parameters rather than
+        inlined literals.
         
         Args:
             config: Table extraction configuration
             
         Returns:
-            Pandas DataFrame containing all table data
+            Tuple of SQL query string and its bound parameters
         """
-        logger.info(f"Performing full extraction from {config.table_name}")
-        
-        # Build query
         columns_str = self._build_column_list(config.columns)
         table_name = config.get_full_table_name()
         
         query = f"SELECT {columns_str} FROM {table_name}"
         
+        where_conditions = []
+        params: Dict[str, Any] = {}
+        
+        if config.extraction_mode == ExtractionMode.INCREMENTAL_DATE:
+            # Build WHERE clause for date range
+            if config.start_date:
+                where_conditions.append(
+                    f"{config.date_column} > :start_date"  # Changed >= to > to avoid duplicates
+                )
+                params['start_date'] = config.start_date
+            
+            if config.end_date:
+                where_conditions.append(
+                    f"{config.date_column} < :end_date"
+                )
+                params['end_date'] = config.end_date
+        
         if config.where_clause:
-            query += f" WHERE {config.where_clause}"
+            where_conditions.append(f"({config.where_clause})")
+        
+        if where_conditions:
+            query += " WHERE " + " AND ".join(where_conditions)
         
         if config.order_by:
             query += f" ORDER BY {config.order_by}"
+        elif config.extraction_mode == ExtractionMode.INCREMENTAL_DATE:
+            # Default order by date column
+            query += f" ORDER BY {config.date_column}"
+        
+        return query, params
+    
+    def extract_batches(self, config: TableConfig) -> Iterator[pd.DataFrame]:
+        """
+        Extract data in DataFrame chunks of ``config.batch_size`` rows.
+        
+        Rows are streamed through a server-side cursor and fetched chunk by
+        chunk, so at most about one batch is held in memory at a time.
+        
+        Args:
+            config: Table extraction configuration
+            
+        Yields:
+            Pandas DataFrames with at most ``config.batch_size`` rows
+        """
+        if not self.validate_extraction_config(config.__dict__):
+            raise ValueError("Invalid extraction configuration")
+        
+        query, params = self._build_query(config)
+        logger.info(
+            f"Performing batched extraction from {config.table_name} "
+            f"(batch size: {config.batch_size})"
+        )
+        
+        try:
+            engine = self.connector.get_connection()
+            
+            # Run through SQLAlchemy so text() binds the date parameters; stream_results
+            # keeps psycopg2 from buffering the whole result set on execute
+            with engine.connect() as conn:
+                conn = conn.execution_options(
+                    stream_results=True, max_row_buffer=config.batch_size
+                )
+                for chunk in pd.read_sql(text(query), conn, params=params, chunksize=config.batch_size):
+                    yield self._serialize_timestamps(chunk)
+            
+        except Exception as e:
+            logger.error(f"Error in batched extraction from {config.table_name}: {e}")
+            raise
+    
+    def _extract_full(self, config: TableConfig) -> pd.DataFrame:
+        """
+        Perform full table extraction.
+        
+        Args:
+            config: Table extraction configuration
+            
+        Returns:
+            Pandas DataFrame containing all table data
+        """
+        logger.info(f"Performing full extraction from {config.table_name}")
+        
+        query, params = self._build_query(config)
         
         # Execute query and load into DataFrame
         try:
             engine = self.connector.get_connection()
             
-            # Get raw DBAPI connection for pandas compatibility
+            # Run through SQLAlchemy so text() binds any parameters
             with engine.connect() as conn:
-                # Access the underlying DBAPI connection
-                raw_conn = conn.connection
-                df = pd.read_sql(query, raw_conn)
+                df = pd.read_sql(text(query), conn, params=params)
                 df = self._serialize_timestamps(df)
             
             logger.info(f"Extracted {len(df)} rows from {config.table_name}")
@@ -147,45 +233,19 @@ class PostgresExtractor(BaseExtractor):
             f"using column {config.date_column}"
         )
         
-        # Build query
-        columns_str = self._build_column_list(config.columns)
-        table_name = config.get_full_table_name()
-        
-        query = f"SELECT {columns_str} FROM {table_name}"
-        
-        # Build WHERE clause for date range
-        where_conditions = []
-        
-        if config.start_date:
-            where_conditions.append(
-                f"{config.date_column} > '{config.start_date.isoformat()}'"  # Changed >= to > to avoid duplicates
-            )
-        
-        if config.end_date:
-            where_conditions.append(
-                f"{config.date_column} < '{config.end_date.isoformat()}'"
-            )
-        
-        if config.where_clause:
-            where_conditions.append(f"({config.where_clause})")
-        
-        if where_conditions:
-            query += " WHERE " + " AND ".join(where_conditions)
-        
-        if config.order_by:
-            query += f" ORDER BY {config.order_by}"
-        else:
-            # Default order by date column
-            query += f" ORDER BY {config.date_column}"
+        query, params = self._build_query(config)
         
         # Execute query
         try:
             engine = self.connector.get_connection()
             
-            # Get raw DBAPI connection for pandas compatibility
+            # Run through SQLAlchemy so text() binds the date parameters; stream_results
+            # keeps psycopg2 from buffering the whole result set on execute
             with engine.connect() as conn:
-                raw_conn = conn.connection
-                df = pd.read_sql(query, raw_conn)
+                conn = conn.execution_options(
+                    stream_results=True, max_row_buffer=config.batch_size
+                )
+                df = pd.read_sql(text(query), conn, params=params)
                 df = self._serialize_timestamps(df)
             
             logger.info(
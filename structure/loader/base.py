@@ -12,6 +12,8 @@ class BaseLoader(ABC):
     Defines the interface for data loading.
     """
     
+    __slots__ = ('connector', 'config')
+    
     def __init__(self, connector: Any, **kwargs):
         """
         Initialize the base loader.
@@ -2,16 +2,45 @@
 Elasticsearch loader for indexing documents.
 Supports both single and bulk loading modes.
 """
-from typing import Any, Dict, List, Optional, Union
-from elasticsearch.helpers import bulk, streaming_bulk
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+from elasticsearch.helpers import parallel_bulk, streaming_bulk
+import json
 import logging
-from datetime import datetime
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .base import BaseLoader
 
 
 logger = logging.getLogger(__name__)
 
+# Documents serialized to estimate the average size when auto-tuning bulk_size
+BULK_SIZE_SAMPLE = 32
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize values orjson does not handle natively (e.g. pandas Timestamp, Decimal)."""
+    if obj is pd.NaT or obj is pd.NA:
+        return None
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
 
 class ElasticsearchLoader(BaseLoader):
     """
@@ -19,6 +48,21 @@ class ElasticsearchLoader(BaseLoader):
     Supports single document indexing and bulk operations.
     """
     
+    __slots__ = (
+        'index_name',
+        'doc_type',
+        'id_field',
+        'bulk_size',
+        'max_retries',
+        'raise_on_error',
+        'thread_count',
+        'queue_size',
+        'max_chunk_bytes',
+        'disable_refresh_during_bulk',
+        'auto_tune_bulk_size',
+        '_client',
+    )
+    
     def __init__(
         self,
         connector: Any,
@@ -28,6 +72,11 @@ class ElasticsearchLoader(BaseLoader):
         bulk_size: int = 1000,
         max_retries: int = 3,
         raise_on_error: bool = True,
+        thread_count: int = 4,
+        queue_size: int = 4,
+        max_chunk_bytes: int = 50 * 1024 * 1024,
+        disable_refresh_during_bulk: bool = False,
+        auto_tune_bulk_size: bool = False,
         **kwargs
     ):
         """
@@ -41,6 +90,12 @@ class ElasticsearchLoader(BaseLoader):
             bulk_size: Batch size for bulk operations
             max_retries: Maximum number of retries for failed operations
             raise_on_error: Raise exception on errors
+            thread_count: Number of threads sending bulk chunks in load_batch
+                when max_retries is 0
+            queue_size: Number of prepared chunks queued ahead of the threads
+            max_chunk_bytes: Maximum size in bytes of a single bulk request
+            disable_refresh_during_bulk: Turn off index refresh while bulk loading
+            auto_tune_bulk_size: Derive load_batch chunk size from sampled document size
             **kwargs: Additional loader parameters
         """
         super().__init__(connector, **kwargs)
@@ -50,6 +105,27 @@ class ElasticsearchLoader(BaseLoader):
         self.bulk_size = bulk_size
         self.max_retries = max_retries
         self.raise_on_error = raise_on_error
+        self.thread_count = thread_count
+        self.queue_size = queue_size
+        self.max_chunk_bytes = max_chunk_bytes
+        self.disable_refresh_during_bulk = disable_refresh_during_bulk
+        self.auto_tune_bulk_size = auto_tune_bulk_size
+        self._client = None
+    
+    @property
+    def client(self) -> Any:
+        """
+        Elasticsearch client, resolved from the connector on first use.
+        
+        The cached client is re-resolved whenever the connector no longer
+        holds it, e.g. after a disconnect or reconnect.
+        
+        Returns:
+            Elasticsearch client instance
+        """
+        if self._client is None or self._client is not getattr(self.connector, '_connection', None):
+            self._client = self.connector.get_connection()
+        return self._client
     
     def load(
         self,
@@ -70,7 +146,7 @@ class ElasticsearchLoader(BaseLoader):
             raise ValueError("Invalid data for loading")
         
         try:
-            client = self.connector.get_connection()
+            client = self.client
             
             # Extract document ID if id_field is specified
             doc_id = kwargs.get('doc_id')
@@ -79,7 +155,7 @@ class ElasticsearchLoader(BaseLoader):
             
             # Add metadata
             if kwargs.get('add_timestamp', True):
-                data['_indexed_at'] = datetime.utcnow().isoformat()
+                data['_indexed_at'] = datetime.now(timezone.utc).isoformat()
             
             # Index document
             response = client.index(
@@ -104,7 +180,12 @@ class ElasticsearchLoader(BaseLoader):
         **kwargs
     ) -> bool:
         """
-        Load multiple documents using bulk API.
+        Load multiple documents using the bulk API.
+        
+        With ``max_retries`` set, chunks are sent sequentially and documents
+        rejected with 429 are retried with exponential backoff; with
+        ``max_retries=0`` chunks are sent from a pool of ``thread_count``
+        threads without retries.
         
         Args:
             data: List of documents to load
@@ -118,20 +199,46 @@ class ElasticsearchLoader(BaseLoader):
             return True
         
         try:
-            client = self.connector.get_connection()
+            client = self.client
             
             # Prepare bulk actions
-            actions = self._prepare_bulk_actions(data, **kwargs)
+            chunk_size = self._effective_chunk_size(data)
+            actions = self._iter_bulk_actions(data, **kwargs)
+            
+            # parallel_bulk has no retry support, so only use it when
+            # retries are disabled
+            if self.max_retries > 0:
+                results = streaming_bulk(
+                    client,
+                    actions,
+                    chunk_size=chunk_size,
+                    max_chunk_bytes=self.max_chunk_bytes,
+                    max_retries=self.max_retries,
+                    raise_on_error=False,
+                    raise_on_exception=self.raise_on_error
+                )
+            else:
+                results = parallel_bulk(
+                    client,
+                    actions,
+                    thread_count=self.thread_count,
+                    queue_size=self.queue_size,
+                    chunk_size=chunk_size,
+                    max_chunk_bytes=self.max_chunk_bytes,
+                    raise_on_error=False,
+                    raise_on_exception=self.raise_on_error
+                )
             
             # Execute bulk operation
-            success, failed = bulk(
-                client,
-                actions,
-                chunk_size=self.bulk_size,
-                max_retries=self.max_retries,
-                raise_on_error=self.raise_on_error,
-                raise_on_exception=self.raise_on_error
-            )
+            success = 0
+            failed = []
+            
+            with self._refresh_paused(client):
+                for ok, response in results:
+                    if ok:
+                        success += 1
+                    else:
+                        failed.append(response)
             
             logger.info(
                 f"Bulk load completed: {success} successful, {len(failed)} failed"
@@ -150,41 +257,42 @@ class ElasticsearchLoader(BaseLoader):
     
     def load_streaming(
         self,
-        data: List[Dict[str, Any]],
+        data: Iterable[Dict[str, Any]],
         **kwargs
     ) -> Dict[str, int]:
         """
         Load documents using streaming bulk API (memory efficient).
         
         Args:
-            data: List of documents to load
+            data: Documents to load; any iterable, consumed lazily
             **kwargs: Additional parameters
             
         Returns:
             Dictionary with success and failure counts
         """
+        success_count = 0
+        error_count = 0
+        
         try:
-            client = self.connector.get_connection()
+            client = self.client
             
             # Prepare bulk actions
-            actions = self._prepare_bulk_actions(data, **kwargs)
+            actions = self._iter_bulk_actions(data, **kwargs)
             
             # Execute streaming bulk
-            success_count = 0
-            error_count = 0
-            
-            for ok, response in streaming_bulk(
-                client,
-                actions,
-                chunk_size=self.bulk_size,
-                max_retries=self.max_retries,
-                raise_on_error=False
-            ):
-                if ok:
-                    success_count += 1
-                else:
-                    error_count += 1
-                    logger.error(f"Failed to index document: {response}")
+            with self._refresh_paused(client):
+                for ok, response in streaming_bulk(
+                    client,
+                    actions,
+                    chunk_size=self.bulk_size,
+                    max_retries=self.max_retries,
+                    raise_on_error=False
+                ):
+                    if ok:
+                        success_count += 1
+                    else:
+                        error_count += 1
+                        logger.error(f"Failed to index document: {response}")
             
             logger.info(
                 f"Streaming bulk completed: {success_count} successful, "
@@ -197,53 +305,136 @@ class ElasticsearchLoader(BaseLoader):
             logger.error(f"Error in streaming bulk load: {e}")
             if self.raise_on_error:
                 raise
-            return {'success': 0, 'failed': len(data)}
+            if isinstance(data, list):
+                return {'success': 0, 'failed': len(data)}
+            return {'success': success_count, 'failed': error_count}
+    
+    def _effective_chunk_size(self, data: List[Dict[str, Any]]) -> int:
+        """
+        Pick the number of documents per bulk request.
+        
+        With auto-tuning enabled, the average serialized size of a sample of
+        documents bounds the chunk so that one request stays within
+        ``max_chunk_bytes``; ``bulk_size`` remains the upper limit.
+        
+        Args:
+            data: Documents about to be loaded
+            
+        Returns:
+            Documents per bulk request
+        """
+        if not self.auto_tune_bulk_size or len(data) <= BULK_SIZE_SAMPLE:
+            return self.bulk_size
+        
+        sample = data[:BULK_SIZE_SAMPLE]
+        if orjson is not None:
+            total = sum(
+                len(orjson.dumps(doc, default=_orjson_default, option=_ORJSON_OPTIONS))
+                for doc in sample
+            )
+        else:
+            total = sum(len(json.dumps(doc, default=_orjson_default).encode('utf-8')) for doc in sample)
+        
+        avg_doc_size = max(total // len(sample), 1)
+        chunk_size = max(min(self.bulk_size, self.max_chunk_bytes // avg_doc_size), 1)
+        logger.debug(f"Bulk chunk size {chunk_size} for ~{avg_doc_size} byte documents")
+        return chunk_size
     
-    def _prepare_bulk_actions(
+    @contextmanager
+    def _refresh_paused(self, client: Any) -> Iterator[None]:
+        """
+        Disable index refresh for the duration of a bulk load when configured.
+        
+        The previous refresh_interval is restored afterwards (None resets it
+        to the cluster default) and the index is refreshed once so the new
+        documents become searchable. An index that does not exist yet is
+        left to be created by the bulk request with default settings.
+        
+        Args:
+            client: Elasticsearch client
+        """
+        if not self.disable_refresh_during_bulk or not client.indices.exists(index=self.index_name):
+            yield
+            return
+        
+        settings = client.indices.get_settings(
+            index=self.index_name, name='index.refresh_interval'
+        )
+        previous = (
+            settings.get(self.index_name, {})
+            .get('settings', {})
+            .get('index', {})
+            .get('refresh_interval')
+        )
+        
+        client.indices.put_settings(
+            index=self.index_name, body={'index': {'refresh_interval': '-1'}}
+        )
+        try:
+            yield
+        finally:
+            client.indices.put_settings(
+                index=self.index_name, body={'index': {'refresh_interval': previous}}
+            )
+            client.indices.refresh(index=self.index_name)
+    
+    def _iter_bulk_actions(
         self,
-        data: List[Dict[str, Any]],
+        data: Iterable[Dict[str, Any]],
         **kwargs
-    ) -> List[Dict[str, Any]]:
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Prepare bulk actions for Elasticsearch.
+        Lazily build bulk actions for Elasticsearch.
+        
+        Actions are yielded one at a time so the bulk helpers can consume
+        them chunk by chunk without a fully materialized list. When orjson is
+        installed, each document is serialized here and the client passes the
+        bytes through instead of re-encoding the dict with the stdlib json.
         
         Args:
-            data: List of documents
+            data: Iterable of documents
             **kwargs: Additional parameters
             
-        Returns:
-            List of bulk action dictionaries
+        Yields:
+            Bulk action dictionaries
         """
-        actions = []
         add_timestamp = kwargs.get('add_timestamp', True)
         
+        # One indexing timestamp for the whole batch
+        indexed_at = datetime.now(timezone.utc).isoformat() if add_timestamp else None
+        
+        # Action fields shared by every document, built once per batch
+        header = {
+            '_op_type': 'index',
+            '_index': self.index_name
+        }
+        
+        # Add routing if specified
+        if 'routing' in kwargs:
+            header['routing'] = kwargs['routing']
+        
+        id_field = self.id_field
+        
         for doc in data:
-            # Extract document ID
-            doc_id = None
-            if self.id_field and self.id_field in doc:
-                doc_id = doc[self.id_field]
-            
             # Add metadata
-            if add_timestamp:
-                doc['_indexed_at'] = datetime.utcnow().isoformat()
+            if indexed_at:
+                doc['_indexed_at'] = indexed_at
             
-            # Create action
+            # Create action; with orjson the source goes to the client pre-serialized
             action = {
-                '_op_type': 'index',
-                '_index': self.index_name,
-                '_source': doc
+                **header,
+                '_source': (
+                    orjson.dumps(doc, default=_orjson_default, option=_ORJSON_OPTIONS)
+                    if orjson is not None else doc
+                )
             }
             
+            # Extract document ID
+            doc_id = doc.get(id_field) if id_field else None
             if doc_id:
                 action['_id'] = doc_id
             
-            # Add routing if specified
-            if 'routing' in kwargs:
-                action['routing'] = kwargs['routing']
-            
-            actions.append(action)
-        
-        return actions
+            yield action
     
     def validate(self, data: Any) -> bool:
         """
@@ -261,10 +452,10 @@ class ElasticsearchLoader(BaseLoader):
                 logger.warning("Empty data list")
                 return True
             
-            for item in data:
-                if not isinstance(item, dict):
-                    logger.error(f"Invalid item in batch: {type(item)}")
-                    return False
+            if not all(isinstance(item, dict) for item in data):
+                item = next(item for item in data if not isinstance(item, dict))
+                logger.error(f"Invalid item in batch: {type(item)}")
+                return False
         elif isinstance(data, dict):
             # Valid single document
             return True
@@ -290,7 +481,7 @@ class ElasticsearchLoader(BaseLoader):
             True if successful, False otherwise
         """
         try:
-            client = self.connector.get_connection()
+            client = self.client
             response = client.delete(
                 index=self.index_name,
                 id=doc_id,
@@ -322,7 +513,7 @@ class ElasticsearchLoader(BaseLoader):
             Number of documents deleted
         """
         try:
-            client = self.connector.get_connection()
+            client = self.client
             response = client.delete_by_query(
                 index=self.index_name,
                 body={'query': query},
@@ -357,7 +548,7 @@ class ElasticsearchLoader(BaseLoader):
             True if successful, False otherwise
         """
         try:
-            client = self.connector.get_connection()
+            client = self.client
             response = client.update(
                 index=self.index_name,
                 id=doc_id,
@@ -385,7 +576,7 @@ class ElasticsearchLoader(BaseLoader):
             Document count
         """
         try:
-            client = self.connector.get_connection()
+            client = self.client
             
             if query:
                 response = client.count(index=self.index_name, body={'query': query})
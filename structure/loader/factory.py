@@ -18,6 +18,10 @@ class LoaderType(Enum):
     ES = "es"
 
 
+# Enum members keyed by value, so lookups skip Enum construction
+_LOADER_TYPES_BY_VALUE: Dict[str, LoaderType] = {member.value: member for member in LoaderType}
+
+
 class LoaderFactory:
     """
     Factory class for creating loader instances.
@@ -51,7 +55,9 @@ class LoaderFactory:
         """
         try:
             # Normalize loader type
-            load_type = LoaderType(loader_type.lower())
+            load_type = _LOADER_TYPES_BY_VALUE.get(loader_type.lower())
+            if load_type is None:
+                raise ValueError(f"'{loader_type}' is not a valid LoaderType")
             
             # Get loader class from registry
             loader_class = cls._loader_registry.get(load_type)
@@ -61,7 +67,7 @@ class LoaderFactory:
             
             # Create and return loader instance
             loader = loader_class(connector, **kwargs)
-            logger.info(f"Created {loader_type} loader")
+            logger.debug(f"Created {loader_type} loader")
             
             return loader
             
@@ -13,6 +13,8 @@ class BaseTransformer(ABC):
     Defines the interface for data transformation.
     """
     
+    __slots__ = ('config',)
+    
     def __init__(self, **kwargs):
         """
         Initialize the base transformer.
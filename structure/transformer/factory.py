@@ -17,6 +17,10 @@ class TransformerType(Enum):
     JSON = "json"
 
 
+# Enum members keyed by value, so lookups skip Enum construction
+_TRANSFORMER_TYPES_BY_VALUE: Dict[str, TransformerType] = {member.value: member for member in TransformerType}
+
+
 class TransformerFactory:
     """
     Factory class for creating transformer instances.
@@ -47,7 +51,9 @@ class TransformerFactory:
         """
         try:
             # Normalize transformer type
-            trans_type = TransformerType(transformer_type.lower())
+            trans_type = _TRANSFORMER_TYPES_BY_VALUE.get(transformer_type.lower())
+            if trans_type is None:
+                raise ValueError(f"'{transformer_type}' is not a valid TransformerType")
             
             # Get transformer class from registry
             transformer_class = cls._transformer_registry.get(trans_type)
@@ -57,7 +63,7 @@ class TransformerFactory:
             
             # Create and return transformer instance
             transformer = transformer_class(**kwargs)
-            logger.info(f"Created {transformer_type} transformer")
+            logger.debug(f"Created {transformer_type} transformer")
             
             return transformer
             
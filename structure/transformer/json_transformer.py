@@ -1,6 +1,8 @@
 """
 JSON transformer for converting DataFrames to JSON format.
 """
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import Any, Dict, List, Optional, Union
 import pandas as pd
 import json
@@ -9,11 +11,76 @@ from datetime import datetime, date
 from decimal import Decimal
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..utils import isoformat_series
 from .base import BaseTransformer
 
 
 logger = logging.getLogger(__name__)
 
+# Smallest frame transform_batch(parallel=True) hands to worker processes
+PARALLEL_MIN_ROWS = 10000
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Convert values orjson does not serialize natively; mirrors _serialize_special_types."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if obj is pd.NaT or obj is pd.NA:
+        return None
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _isoformat(value: Any) -> Any:
+    return value.isoformat()
+
+
+def _float_or_none(value: float) -> Optional[float]:
+    # NaN is the only float not equal to itself
+    return None if value != value else value
+
+
+def _numpy_scalar(value: Any) -> Any:
+    return _float_or_none(value.item()) if isinstance(value, np.floating) else value.item()
+
+
+# Exact-type handlers for leaf values in _serialize_special_types; types not
+# listed here (containers, subclasses, NA markers) go through the isinstance chain
+_SPECIAL_TYPE_HANDLERS = {
+    str: _identity,
+    int: _identity,
+    bool: _identity,
+    float: _float_or_none,
+    datetime: _isoformat,
+    date: _isoformat,
+    pd.Timestamp: _isoformat,
+    Decimal: float,
+    np.int64: _numpy_scalar,
+    np.int32: _numpy_scalar,
+    np.float64: _numpy_scalar,
+    np.float32: _numpy_scalar,
+    np.bool_: _numpy_scalar,
+}
+
+
+def _transform_batch_frame(
+    transformer: 'JSONTransformer',
+    batch_df: pd.DataFrame,
+    kwargs: Dict[str, Any]
+) -> Union[List[Dict], str]:
+    """Transform one batch in a worker process for transform_batch."""
+    return transformer.transform(batch_df, **kwargs)
+
 
 class JSONTransformer(BaseTransformer):
     """
@@ -21,6 +88,8 @@ class JSONTransformer(BaseTransformer):
     Supports various JSON output formats and handles data type conversions.
     """
     
+    __slots__ = ('orient', 'date_format', 'handle_nan', 'include_index', 'indent')
+    
     def __init__(
         self,
         orient: str = 'records',
@@ -75,7 +144,9 @@ class JSONTransformer(BaseTransformer):
             if self.handle_nan == 'drop':
                 data = data.dropna()
             elif self.handle_nan == 'null':
-                data = data.replace({np.nan: None})
+                # NaN already becomes null downstream: to_json writes null and
+                # _to_json_compatible maps NaN to None, so no full-frame pass here
+                pass
             elif self.handle_nan == 'string':
                 data = data.fillna('null')
             
@@ -90,10 +161,10 @@ class JSONTransformer(BaseTransformer):
                 )
             else:
                 # Return as Python objects (list of dicts)
-                json_data = data.to_dict(orient=self.orient)
+                json_data = self._to_python(data)
                 
                 # Apply custom serialization for special types
-                json_data = self._serialize_special_types(json_data)
+                json_data = self._to_json_compatible(json_data)
             
             # Postprocess
             json_data = self.postprocess(json_data)
@@ -105,6 +176,61 @@ class JSONTransformer(BaseTransformer):
             logger.error(f"Error transforming to JSON: {e}")
             raise
     
+    def _to_python(self, data: pd.DataFrame) -> Any:
+        """
+        Convert a DataFrame to Python objects in the configured orientation.
+        
+        Args:
+            data: Input DataFrame
+            
+        Returns:
+            Records list or ``to_dict`` output for other orients
+        """
+        if self.orient == 'records':
+            return self._to_records(data)
+        return data.to_dict(orient=self.orient)
+    
+    def _to_records(self, data: pd.DataFrame) -> List[Dict]:
+        """
+        Convert a DataFrame to a list of row dicts.
+        
+        Columns are converted to Python lists once and zipped row-wise,
+        avoiding the per-row overhead of ``to_dict(orient='records')``.
+        
+        Args:
+            data: Input DataFrame
+            
+        Returns:
+            List of records
+        """
+        columns = data.columns.tolist()
+        values = [data.iloc[:, i].tolist() for i in range(len(columns))]
+        return [dict(zip(columns, row)) for row in zip(*values)]
+    
+    def _to_json_compatible(self, data: Any) -> Any:
+        """
+        Convert special types to JSON-compatible values.
+        
+        With orjson installed the data is round-tripped through orjson in
+        C, so only values orjson cannot handle reach Python. Anything
+        neither path can encode falls back to the recursive walk.
+        
+        Args:
+            data: Data to convert
+            
+        Returns:
+            JSON-compatible data
+        """
+        if orjson is not None:
+            try:
+                return orjson.loads(
+                    orjson.dumps(data, default=_orjson_default, option=orjson.OPT_SERIALIZE_NUMPY)
+                )
+            except orjson.JSONEncodeError:
+                pass
+        
+        return self._serialize_special_types(data)
+    
     def _serialize_special_types(self, data: Any) -> Any:
         """
         Serialize special data types to JSON-compatible formats.
@@ -115,10 +241,17 @@ class JSONTransformer(BaseTransformer):
         Returns:
             Serialized data
         """
+        handler = _SPECIAL_TYPE_HANDLERS.get(type(data))
+        if handler is not None:
+            return handler(data)
+        
         if isinstance(data, dict):
             return {key: self._serialize_special_types(value) for key, value in data.items()}
         elif isinstance(data, list):
             return [self._serialize_special_types(item) for item in data]
+        elif data is pd.NaT or data is pd.NA:
+            # NaT subclasses datetime and would otherwise format as 'NaT'
+            return None
         elif isinstance(data, (datetime, date)):
             return data.isoformat()
         elif isinstance(data, Decimal):
@@ -160,33 +293,38 @@ class JSONTransformer(BaseTransformer):
         Returns:
             Preprocessed DataFrame
         """
-        # Create a copy to avoid modifying original
-        df = data.copy()
+        # Collect replacement columns; the input frame is never modified
+        converted = {}
         
         # Convert datetime columns to appropriate format
-        for col in df.select_dtypes(include=['datetime64']).columns:
+        for col in data.select_dtypes(include=['datetime64']).columns:
+            values = data[col]
             if self.date_format == 'iso':
-                df[col] = df[col].apply(
-                    lambda x: x.isoformat() if pd.notna(x) else None
-                )
+                converted[col] = isoformat_series(values)
             elif self.date_format == 'epoch':
-                df[col] = df[col].apply(
-                    lambda x: int(x.timestamp()) if pd.notna(x) else None
-                )
+                converted[col] = values.apply(lambda x: int(x.timestamp()) if pd.notna(x) else None)
         
         # Handle binary/bytes columns
-        for col in df.select_dtypes(include=['object']).columns:
-            if df[col].apply(lambda x: isinstance(x, bytes)).any():
-                df[col] = df[col].apply(
-                    lambda x: x.decode('utf-8') if isinstance(x, bytes) else x
-                )
+        for col in data.select_dtypes(include=['object']).columns:
+            values = data[col]
+            is_bytes = values.map(type).eq(bytes)
+            if is_bytes.any():
+                decoded = values.copy()
+                decoded[is_bytes] = values[is_bytes].str.decode('utf-8')
+                converted[col] = decoded
+        
+        # Only copy when something changed, and then only via the converted columns
+        if not converted:
+            return data
         
-        return df
+        return data.assign(**converted)
     
     def transform_batch(
         self,
         data: pd.DataFrame,
         batch_size: int = 1000,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
         **kwargs
     ) -> List[List[Dict]]:
         """
@@ -195,21 +333,35 @@ class JSONTransformer(BaseTransformer):
         Args:
             data: Input DataFrame
             batch_size: Size of each batch
+            parallel: Transform batches in a process pool; frames smaller than
+                PARALLEL_MIN_ROWS are still transformed in-process
+            max_workers: Maximum number of worker processes (None for CPU count)
             **kwargs: Additional transformation parameters
             
         Returns:
             List of batches (each batch is a list of dicts)
         """
-        batches = []
+        batch_frames = [
+            data.iloc[start_idx:start_idx + batch_size]
+            for start_idx in range(0, len(data), batch_size)
+        ]
         
-        for start_idx in range(0, len(data), batch_size):
-            end_idx = min(start_idx + batch_size, len(data))
-            batch_df = data.iloc[start_idx:end_idx]
-            
-            batch_json = self.transform(batch_df, **kwargs)
-            batches.append(batch_json)
+        if parallel and len(batch_frames) > 1 and len(data) >= PARALLEL_MIN_ROWS:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                batches = list(executor.map(
+                    _transform_batch_frame,
+                    repeat(self),
+                    batch_frames,
+                    repeat(kwargs)
+                ))
+        else:
+            batches = []
             
-            logger.debug(f"Transformed batch {start_idx}-{end_idx}")
+            for start_idx, batch_df in zip(range(0, len(data), batch_size), batch_frames):
+                batch_json = self.transform(batch_df, **kwargs)
+                batches.append(batch_json)
+                
+                logger.debug(f"Transformed batch {start_idx}-{start_idx + len(batch_df)}")
         
         logger.info(f"Transformed {len(batches)} batches")
         return batches
@@ -249,14 +401,21 @@ class JSONTransformer(BaseTransformer):
         Returns:
             Flattened records
         """
-        def flatten_dict(d: Dict, parent_key: str = '', sep: str = '_') -> Dict:
-            items = []
-            for k, v in d.items():
-                new_key = f"{parent_key}{sep}{k}" if parent_key else k
-                if isinstance(v, dict):
-                    items.extend(flatten_dict(v, new_key, sep=sep).items())
+        def flatten_dict(d: Dict, sep: str = '_') -> Dict:
+            # Depth-first walk with an explicit stack of (prefix, items) iterators,
+            # writing leaves straight into one output dict in their original order
+            flat = {}
+            stack = [('', iter(d.items()))]
+            while stack:
+                parent_key, items = stack[-1]
+                for k, v in items:
+                    new_key = f"{parent_key}{sep}{k}" if parent_key else k
+                    if isinstance(v, dict):
+                        stack.append((new_key, iter(v.items())))
+                        break
+                    flat[new_key] = v
                 else:
-                    items.append((new_key, v))
-            return dict(items)
+                    stack.pop()
+            return flat
         
         return [flatten_dict(record, sep=separator) for record in data]
\ No newline at end of file
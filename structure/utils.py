@@ -0,0 +1,37 @@
+"""
+Helpers shared by the extractor and transformer modules.
+"""
+import numpy as np
+import pandas as pd
+
+
+def isoformat_series(values: pd.Series) -> pd.Series:
+    """
+    Format a datetime column exactly like ``Timestamp.isoformat()``.
+    
+    Naive columns without sub-microsecond values are formatted in bulk by
+    NumPy; timezone-aware and nanosecond columns keep per-value
+    ``isoformat()`` so the source offset and precision are preserved.
+    
+    Args:
+        values: Datetime Series
+    
+    Returns:
+        Object Series of ISO strings, with None for NaT
+    """
+    if values.dt.tz is None and not values.dt.nanosecond.any():
+        # NumPy's C-level ISO formatter gives 'YYYY-MM-DDTHH:MM:SS.ffffff';
+        # like isoformat(), drop the fraction when it is zero
+        iso = values.to_numpy().astype('datetime64[us]').astype(str)
+        iso = np.where(values.dt.microsecond.to_numpy() == 0, iso.astype('U19'), iso)
+        return pd.Series(
+            np.where(values.isna().to_numpy(), None, iso.astype(object)),
+            index=values.index,
+            dtype=object
+        )
+    
+    return pd.Series(
+        [x.isoformat() if pd.notna(x) else None for x in values],
+        index=values.index,
+        dtype=object
+    )